@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from .compute import fibonacci, parse_and_serialize_json, prime_sieve
+from .compute import fibonacci, parse_and_serialize_json, prime_count, prime_sieve
 
 __all__ = [
     "fibonacci",
     "parse_and_serialize_json",
+    "prime_count",
     "prime_sieve",
     "run_benchmarks",
     "main",
@@ -5,8 +5,8 @@ from __future__ import annotations
 import json
 import math
 import random
-from queue import SimpleQueue
-from threading import Thread
+from concurrent.futures import ThreadPoolExecutor
+from itertools import compress
 from typing import List
 
 
@@ -21,28 +21,50 @@ def fibonacci(n: int) -> int:
     return b
 
 def fibonacci2(n: int) -> int:
-    """Compute the nth Fibonacci number using an recurcive algorithm."""
+    """Compute the nth Fibonacci number using a naive recursive algorithm.
+
+    The exponential call tree is intentional: the workload measures the
+    interpreter's function-call overhead, so it must stay pure Python.
+    """
     if n <= 1:
         return n
     else:
         return fibonacci2(n-1) + fibonacci2(n-2)
 
 
+def _odd_sieve(limit: int) -> bytearray:
+    """Sieve the odd numbers below *limit*; index ``i`` stands for ``2 * i + 1``.
+
+    The flags live in a ``bytearray`` (one byte per cell) rather than a list
+    of object pointers.  *limit* must be at least 3.
+    """
+    size = limit // 2
+    sieve = bytearray(b"\x01") * size
+    sieve[0] = 0
+
+    for number in range(3, int(math.sqrt(limit)) + 1, 2):
+        if sieve[number // 2]:
+            step = number
+            start = number * number // 2
+            sieve[start:size:step] = bytes(len(range(start, size, step)))
+
+    return sieve
+
+
 def prime_sieve(limit: int) -> List[int]:
     """Return all prime numbers below *limit* using the Sieve of Eratosthenes."""
-    if limit < 2:
+    if limit < 3:
         return []
 
-    sieve = [True] * limit
-    sieve[0] = sieve[1] = False
+    return [2, *compress(range(1, limit, 2), _odd_sieve(limit))]
 
-    for number in range(2, int(math.sqrt(limit)) + 1):
-        if sieve[number]:
-            step = number
-            start = number * number
-            sieve[start:limit:step] = [False] * len(range(start, limit, step))
 
-    return [index for index, is_prime in enumerate(sieve) if is_prime]
+def prime_count(limit: int) -> int:
+    """Return the number of primes below *limit* without materializing them."""
+    if limit < 3:
+        return 0
+
+    return 1 + _odd_sieve(limit).count(1)
 
 
 def parse_and_serialize_json(payload_size: int) -> int:
@@ -50,8 +72,9 @@ def parse_and_serialize_json(payload_size: int) -> int:
     if payload_size <= 0:
         raise ValueError("payload_size must be positive")
 
+    rand = random.random
     payload = {
-        "numbers": [random.random() for _ in range(payload_size)],
+        "numbers": [rand() for _ in range(payload_size)],
         "nested": {"a": "value", "b": list(range(payload_size))},
         "flag": True,
     }
@@ -83,33 +106,26 @@ def threaded_trigonometry(workers: int, iterations: int) -> int:
     if iterations <= 0:
         raise ValueError("iterations must be positive")
 
-    results: "SimpleQueue[float]" = SimpleQueue()
+    sin = math.sin
+    cos = math.cos
 
-    def worker(offset: int) -> None:
+    def worker(offset: int) -> float:
         total = 0.0
         for index in range(iterations):
             angle = (offset + index) * 0.0003
-            total += math.sin(angle) * math.cos(angle * 0.5)
-        results.put(total)
-
-    threads = [
-        Thread(target=worker, args=(worker_id * iterations,), daemon=False)
-        for worker_id in range(workers)
-    ]
-    for thread in threads:
-        thread.start()
-    for thread in threads:
-        thread.join()
-
-    aggregate = 0.0
-    for _ in range(workers):
-        aggregate += results.get()
+            total += sin(angle) * cos(angle * 0.5)
+        return total
+
+    offsets = [worker_id * iterations for worker_id in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        aggregate = sum(executor.map(worker, offsets))
     return int(aggregate * 1_000_000)
 
 
 __all__ = [
     "fibonacci",
     "prime_sieve",
+    "prime_count",
     "parse_and_serialize_json",
     "fibonacci2",
     "bubble_sort",
@@ -28,14 +28,18 @@ relative to the sequential baseline.
 from __future__ import annotations
 
 import argparse
+import atexit
 import json
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
+from itertools import repeat
+import multiprocessing
 import os
 import platform
 import sys
 import time
-from time import perf_counter
+from time import perf_counter_ns
 from pathlib import Path
 from typing import Callable, Dict, Iterable, List, Sequence
 
@@ -92,36 +96,93 @@ _WORKLOADS: Sequence[WorkloadSpec] = (
 )
 
 
+# Timings are taken as integer nanoseconds and converted to seconds only when
+# reported, so the subtraction itself is exact.
+_NS_PER_SECOND = 1e9
+
+
 def _ensure_positive(name: str, value: int) -> None:
     if value <= 0:
         raise ValueError(f"{name} must be positive, got {value!r}")
 
 
 def _run_sequential(workload: WorkloadSpec, tasks: int) -> float:
-    start = perf_counter()
+    start = perf_counter_ns()
     for _ in range(tasks):
         workload.function(workload.argument)
-    return perf_counter() - start
+    return (perf_counter_ns() - start) / _NS_PER_SECOND
 
 
 def _run_threads(workload: WorkloadSpec, tasks: int, workers: int) -> float:
     if not workload.supports_threads:
         raise UnsupportedStrategyError("workload does not support threads")
 
-    start = perf_counter()
+    start = perf_counter_ns()
     with ThreadPoolExecutor(max_workers=workers) as executor:
-        list(executor.map(workload.function, (workload.argument,) * tasks))
-    return perf_counter() - start
+        list(executor.map(workload.function, repeat(workload.argument, tasks)))
+    return (perf_counter_ns() - start) / _NS_PER_SECOND
+
+
+# The process pool is kept alive between runs so that spawning the workers and
+# importing this module inside them is paid once, outside of any measurement.
+_PROCESS_POOL: ProcessPoolExecutor | None = None
+_PROCESS_POOL_WORKERS = 0
+
+# By the time a pool is (re)created this process may already run other threads,
+# e.g. the thread strategy's workers or a previous pool's management thread.
+# Forking workers from it is unsafe and warned about on Python 3.12+, so they
+# are started from a single-threaded fork server where the platform has one.
+_PROCESS_POOL_CONTEXT = (
+    multiprocessing.get_context("forkserver")
+    if "forkserver" in multiprocessing.get_all_start_methods()
+    else None
+)
+
+
+def _warm_up(_: object) -> None:
+    return None
+
+
+def _process_pool(workers: int) -> ProcessPoolExecutor:
+    """Return a started process pool with ``workers`` worker processes."""
+
+    global _PROCESS_POOL, _PROCESS_POOL_WORKERS
+
+    if _PROCESS_POOL is not None and _PROCESS_POOL_WORKERS == workers:
+        return _PROCESS_POOL
+
+    _shutdown_process_pool()
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=_PROCESS_POOL_CONTEXT)
+    list(pool.map(_warm_up, range(workers)))
+    _PROCESS_POOL, _PROCESS_POOL_WORKERS = pool, workers
+    return pool
+
+
+def _shutdown_process_pool() -> None:
+    global _PROCESS_POOL
+
+    if _PROCESS_POOL is not None:
+        _PROCESS_POOL.shutdown()
+        _PROCESS_POOL = None
+
+
+atexit.register(_shutdown_process_pool)
 
 
 def _run_processes(workload: WorkloadSpec, tasks: int, workers: int) -> float:
     if not workload.supports_processes:
         raise UnsupportedStrategyError("workload does not support processes")
 
-    start = perf_counter()
-    with ProcessPoolExecutor(max_workers=workers) as executor:
-        list(executor.map(workload.function, (workload.argument,) * tasks))
-    return perf_counter() - start
+    executor = _process_pool(workers)
+    start = perf_counter_ns()
+    try:
+        list(executor.map(workload.function, repeat(workload.argument, tasks)))
+    except BrokenProcessPool:
+        # A dead worker breaks the pool for good; drop it so that the next
+        # workload starts from a fresh one.
+        _shutdown_process_pool()
+        raise
+    return (perf_counter_ns() - start) / _NS_PER_SECOND
 
 
 def _split_work(amount: int, parts: int) -> List[int]:
@@ -130,6 +191,13 @@ def _split_work(amount: int, parts: int) -> List[int]:
     return [base + (1 if index < remainder else 0) for index in range(parts)]
 
 
+_SUBINTERPRETER_SETUP = (
+    "from {module} import {function} as _func\n"
+    "_argument = {argument}\n"
+)
+_SUBINTERPRETER_BATCH = "for _ in range({count}):\n    _func(_argument)\n"
+
+
 def _run_subinterpreters(workload: WorkloadSpec, tasks: int, workers: int) -> float:
     if not workload.supports_subinterpreters:
         raise UnsupportedStrategyError("workload does not support subinterpreters")
@@ -145,28 +213,34 @@ def _run_subinterpreters(workload: WorkloadSpec, tasks: int, workers: int) -> fl
     work_splits = _split_work(tasks, workers)
     interpreters_pool = [interpreters.create() for _ in range(workers)]
 
-    module_name = workload.function.__module__
-    function_name = workload.function.__name__
-    argument_repr = repr(workload.argument)
+    setup_source = _SUBINTERPRETER_SETUP.format(
+        module=workload.function.__module__,
+        function=workload.function.__name__,
+        argument=repr(workload.argument),
+    )
+    batches = [
+        (interp, _SUBINTERPRETER_BATCH.format(count=count))
+        for interp, count in zip(interpreters_pool, work_splits)
+        if count
+    ]
 
-    start = perf_counter()
     try:
-        for interp, count in zip(interpreters_pool, work_splits):
-            if count == 0:
-                continue
-            source = (
-                f"from {module_name} import {function_name} as _func\n"
-                f"for _ in range({count}):\n"
-                f"    _func({argument_repr})\n"
-            )
+        # Importing the workload is one-off setup; each interpreter keeps it in
+        # its ``__main__`` namespace for the timed batch below.
+        for interp, _ in batches:
+            interp.run(setup_source)
+
+        start = perf_counter_ns()
+        for interp, source in batches:
             interp.run(source)
+        duration = (perf_counter_ns() - start) / _NS_PER_SECOND
     finally:  # pragma: no cover - clean-up depends on runtime support
         for interp in interpreters_pool:
             close = getattr(interp, "close", None)
             if callable(close):
                 close()
 
-    return perf_counter() - start
+    return duration
 
 
 def _detect_gil_disabled() -> bool | None:
@@ -253,7 +327,7 @@ def run_concurrency_benchmarks(
         "python_implementation": platform.python_implementation(),
         "tasks": tasks,
         "workers": workers,
-        "gil_disabled": not sys._is_gil_enabled(),
+        "gil_disabled": _detect_gil_disabled(),
     }
 
     runner_map = _runner_mapping()
@@ -10,16 +10,41 @@ from __future__ import annotations
 import argparse
 import json
 import math
+import os
+import re
 import shutil
 import shlex
 import subprocess
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterable, List, Sequence, Tuple
 
+try:  # pragma: no cover - optional accelerator, exercised when installed
+    import orjson
+except ImportError:  # pragma: no cover - depends on the host environment
+    orjson = None
+
+# ``orjson.JSONDecodeError`` subclasses ``json.JSONDecodeError``, so callers
+# handle both parsers the same way.  Both accept the raw file bytes.
+_json_loads = json.loads if orjson is None else orjson.loads
+
 REPO_ROOT = Path(__file__).resolve().parent.parent
 DOCKER_ROOT = REPO_ROOT / "docker"
 
+# Serializes command echoing when builds run on several threads.
+_OUTPUT_LOCK = threading.Lock()
+
+try:
+    _join_command = shlex.join
+except AttributeError:  # pragma: no cover - Python 3.7 images
+
+    def _join_command(split_command: Iterable[str]) -> str:
+        return " ".join(shlex.quote(part) for part in split_command)
+
 
 def _default_results_dir_for_suite(suite: str) -> Path:
     base = REPO_ROOT / "results"
@@ -34,29 +59,24 @@ def _default_results_dir_for_suite(suite: str) -> Path:
 def _baseline_mean(results: Sequence[dict]) -> float | None:
     """Return the CPython 3.14 baseline mean, preferring GIL-enabled builds."""
 
-    def _matches(entry: dict) -> bool:
-        implementation = entry.get("python_implementation")
+    fallback = None
+    for entry in results:
         version = entry.get("python_version", "")
+        if (
+            entry.get("python_implementation") != "CPython"
+            or not isinstance(version, str)
+            or not version.startswith("3.14")
+        ):
+            continue
         mean = entry.get("mean")
-        return (
-            implementation == "CPython"
-            and isinstance(version, str)
-            and version.startswith("3.14")
-            and isinstance(mean, (int, float))
-        )
-
-    def _is_thread_free(version: str) -> bool:
-        return version.lower().endswith("t")
-
-    candidates = [entry for entry in results if _matches(entry)]
-    for entry in candidates:
-        version = entry.get("python_version", "")
-        if isinstance(version, str) and not _is_thread_free(version):
-            return float(entry["mean"])
-
-    if candidates:
-        return float(candidates[0]["mean"])
-    return None
+        if not isinstance(mean, (int, float)):
+            continue
+        # A trailing "t" marks a free-threaded build.
+        if not version.endswith(("t", "T")):
+            return float(mean)
+        if fallback is None:
+            fallback = float(mean)
+    return fallback
 
 
 def _format_relative(relative: float | None) -> str:
@@ -124,25 +144,92 @@ def discover_targets(docker_root: Path = DOCKER_ROOT) -> List[DockerTarget]:
 def run_command(command: Sequence[str], dry_run: bool = False) -> None:
     """Execute ``command`` with optional dry-run logging."""
 
-    print("$", " ".join(shlex.quote(part) for part in command))
+    with _OUTPUT_LOCK:
+        print("$", _join_command(command))
     if dry_run:
         return
     subprocess.run(command, check=True)
 
 
-def build_image(target: DockerTarget, *, context: Path, dry_run: bool) -> None:
-    run_command(
-        [
-            "docker",
-            "build",
-            "-f",
-            str(target.dockerfile),
-            "-t",
-            target.tag,
-            str(context),
-        ],
-        dry_run=dry_run,
-    )
+def _pull_cache_image(image: str, *, dry_run: bool) -> None:
+    """Pull ``image`` for use as a layer cache; a missing image is not an error."""
+
+    try:
+        run_command(["docker", "pull", image], dry_run=dry_run)
+    except subprocess.CalledProcessError:
+        with _OUTPUT_LOCK:
+            print(f"Warning: could not pull cache image '{image}', building without it")
+
+
+def build_image(
+    target: DockerTarget,
+    *,
+    context: Path,
+    dry_run: bool,
+    cache_from: str | None = None,
+    plain_progress: bool = False,
+) -> None:
+    """Build ``target``, optionally seeding the layer cache from a registry.
+
+    ``cache_from`` names an image repository holding previously pushed
+    ``<repository>:<version>`` images.  ``plain_progress`` replaces BuildKit's
+    interactive progress display with line-based output, which stays readable
+    when several builds share the terminal.
+    """
+
+    command: List[str] = [
+        "docker",
+        "build",
+        "-f",
+        str(target.dockerfile),
+        "-t",
+        target.tag,
+    ]
+    if plain_progress:
+        command.append("--progress=plain")
+    if cache_from is not None:
+        cache_image = f"{cache_from}:{target.version}"
+        _pull_cache_image(cache_image, dry_run=dry_run)
+        command.extend(
+            ["--cache-from", cache_image, "--build-arg", "BUILDKIT_INLINE_CACHE=1"]
+        )
+    command.append(str(context))
+    run_command(command, dry_run=dry_run)
+
+
+def _build_images_concurrently(
+    targets: Sequence[DockerTarget],
+    *,
+    context: Path,
+    dry_run: bool,
+    jobs: int,
+    cache_from: str | None,
+) -> None:
+    """Build ``targets`` with up to ``jobs`` concurrent ``docker build`` calls.
+
+    The first failure cancels builds that have not started yet and is re-raised
+    once the running ones finish.  Builds print plain progress so that their
+    interleaved output can still be traced back to each image.
+    """
+
+    with ThreadPoolExecutor(max_workers=min(jobs, len(targets))) as executor:
+        futures = [
+            executor.submit(
+                build_image,
+                target,
+                context=context,
+                dry_run=dry_run,
+                cache_from=cache_from,
+                plain_progress=True,
+            )
+            for target in targets
+        ]
+        wait(futures, return_when=FIRST_EXCEPTION)
+        for future in futures:
+            future.cancel()
+        for future in futures:
+            if not future.cancelled():
+                future.result()
 
 
 def run_container(
@@ -152,9 +239,22 @@ def run_container(
     run_cmd: Sequence[str] | None,
     results_dir: Path | None,
 ) -> None:
+    mount_source = None if results_dir is None else str(results_dir.resolve())
+    _run_container(target, dry_run=dry_run, run_cmd=run_cmd, mount_source=mount_source)
+
+
+def _run_container(
+    target: DockerTarget,
+    *,
+    dry_run: bool,
+    run_cmd: Sequence[str] | None,
+    mount_source: str | None,
+) -> None:
+    """Run ``target`` with ``mount_source``, an already resolved host path."""
+
     command: List[str] = ["docker", "run", "--rm"]
-    if results_dir is not None:
-        command.extend(["-v", f"{results_dir.resolve()}:/app/results"])
+    if mount_source is not None:
+        command.extend(["-v", f"{mount_source}:/app/results"])
     command.append(target.tag)
     if run_cmd:
         command.extend(run_cmd)
@@ -176,19 +276,23 @@ def execute(
     suite: str = "micro",
     tasks: int | None = None,
     workers: int | None = None,
+    build_jobs: int = 1,
+    cache_from: str | None = None,
 ) -> List[DockerTarget]:
     """Build and run all Docker images.
 
+    With ``build_jobs`` greater than one all images are built concurrently
+    before any container runs; containers always run one at a time so that
+    benchmarks do not compete for CPU.  ``cache_from`` names a registry
+    repository whose ``<repository>:<version>`` images seed the build cache.
+
     Returns the ordered list of processed :class:`DockerTarget` objects.
     """
 
-    targets = discover_targets(docker_root)
+    if build_jobs <= 0:
+        raise DockerRunnerError(f"build_jobs must be positive, got {build_jobs!r}")
 
-    if results_dir is not None:
-        if dry_run or skip_run:
-            results_dir.mkdir(parents=True, exist_ok=True)
-        else:
-            _reset_results_dir(results_dir)
+    targets = discover_targets(docker_root)
 
     if run_cmd is not None:
         command_builder = lambda target: [list(run_cmd)]
@@ -205,16 +309,42 @@ def execute(
     else:
         raise DockerRunnerError(f"Unsupported benchmark suite '{suite}'")
 
+    # Nothing will be written, so previous results are left untouched.
+    if not targets:
+        return targets
+
+    if results_dir is not None:
+        if dry_run or skip_run:
+            results_dir.mkdir(parents=True, exist_ok=True)
+        else:
+            _reset_results_dir(results_dir)
+        # Resolved once here instead of once per container.
+        mount_source: str | None = str(results_dir.resolve())
+    else:
+        mount_source = None
+
+    build_per_target = not skip_build and build_jobs == 1
+    if not skip_build and build_jobs > 1:
+        _build_images_concurrently(
+            targets,
+            context=context,
+            dry_run=dry_run,
+            jobs=build_jobs,
+            cache_from=cache_from,
+        )
+
     for target in targets:
-        if not skip_build:
-            build_image(target, context=context, dry_run=dry_run)
+        if build_per_target:
+            build_image(
+                target, context=context, dry_run=dry_run, cache_from=cache_from
+            )
         if not skip_run:
             for command in command_builder(target):
-                run_container(
+                _run_container(
                     target,
                     dry_run=dry_run,
                     run_cmd=command,
-                    results_dir=results_dir,
+                    mount_source=mount_source,
                 )
 
     if (
@@ -259,6 +389,22 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Build images but do not run containers",
     )
+    parser.add_argument(
+        "--build-jobs",
+        type=int,
+        default=1,
+        help="Number of images to build concurrently (runs stay sequential)",
+    )
+    parser.add_argument(
+        "--cache-from",
+        type=str,
+        default=None,
+        metavar="REPOSITORY",
+        help=(
+            "Registry repository with previously pushed <REPOSITORY>:<version> "
+            "images to pull and use as build cache"
+        ),
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -363,6 +509,8 @@ def main(argv: Sequence[str] | None = None) -> int:
             suite=args.suite,
             tasks=args.tasks,
             workers=args.workers,
+            build_jobs=args.build_jobs,
+            cache_from=args.cache_from,
         )
     except (DockerRunnerError, subprocess.CalledProcessError) as exc:
         print(f"Error: {exc}")
@@ -425,20 +573,37 @@ def summarize_results(results_dir: Path, *, suite: str = "micro") -> str | None:
     raise DockerRunnerError(f"Unsupported benchmark suite '{suite}'")
 
 
+def _write_summary(path: Path, summary: dict) -> None:
+    """Write ``summary`` as indented JSON using the standard-library encoder.
+
+    orjson is only used for reading: it formats floats and non-ASCII text
+    differently, and the file must not depend on what the host has installed.
+    The JSON goes to a sibling temporary file that is renamed over ``path``, so
+    an interrupted run leaves the previous summary intact instead of a
+    truncated one.
+    """
+
+    staging = path.with_name(f"{path.name}.tmp")
+    try:
+        with staging.open("w", encoding="utf-8") as handle:
+            json.dump(summary, handle, indent=2)
+        os.replace(staging, path)
+    except BaseException:
+        try:
+            staging.unlink()
+        except FileNotFoundError:
+            pass
+        raise
+
+
 def _summarize_micro_results(results_dir: Path) -> str | None:
     payloads = list(_load_micro_payloads(results_dir))
     if not payloads:
         return None
 
-    sorted_payloads = sorted(
-        payloads,
-        key=lambda payload: (
-            payload.get("python_implementation", ""),
-            _version_sort_key(payload.get("python_version", "")),
-        ),
-    )
+    sorted_payloads = sorted(payloads, key=_micro_payload_sort_key)
     summary = _aggregate_micro_payloads(sorted_payloads)
-    (results_dir / "summary.json").write_text(json.dumps(summary, indent=2))
+    _write_summary(results_dir / "summary.json", summary)
     return _format_micro_summary(summary)
 
 
@@ -449,64 +614,145 @@ def _summarize_concurrency_results(results_dir: Path) -> str | None:
 
     sorted_payloads = sorted(payloads, key=_runtime_metadata_sort_key)
     summary = _aggregate_concurrency_payloads(sorted_payloads)
-    (results_dir / "summary.json").write_text(json.dumps(summary, indent=2))
+    _write_summary(results_dir / "summary.json", summary)
     return _format_concurrency_summary(summary)
 
 
-def _reset_results_dir(results_dir: Path) -> None:
-    """Remove all files/sub-directories under ``results_dir`` and recreate it."""
-
-    if results_dir.exists():
-        for entry in results_dir.iterdir():
-            if entry.is_dir():
-                shutil.rmtree(entry)
+def _clear_results_dir(results_dir: Path) -> None:
+    # ``DirEntry`` caches the file type from the directory read, saving a stat
+    # per entry.
+    with os.scandir(results_dir) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
             else:
-                entry.unlink()
+                os.unlink(entry.path)
+
+
+# Suffix of the hidden ``.<name>.reset-<pid>-<ns>`` staging trees created by
+# ``_reset_results_dir``; no user directory is expected to look like this.
+_STAGING_SUFFIX = re.compile(r"\.reset-[0-9]+-[0-9]+")
+
+
+def _remove_staging_trees(results_dir: Path) -> None:
+    """Delete every staging tree left next to ``results_dir``.
+
+    This includes the tree of the current reset as well as trees from runs
+    that exited before their clean-up finished.
+    """
+
+    prefix = f".{results_dir.name}"
+    try:
+        with os.scandir(results_dir.parent) as entries:
+            staging = [
+                entry.path
+                for entry in entries
+                if entry.name.startswith(prefix)
+                and _STAGING_SUFFIX.fullmatch(entry.name, len(prefix))
+            ]
+    except FileNotFoundError:
+        return
+    for path in staging:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _reset_results_dir(results_dir: Path) -> threading.Thread | None:
+    """Remove all files/sub-directories under ``results_dir`` and recreate it.
+
+    The previous tree is renamed to a hidden staging directory and deleted on
+    a background thread, so the caller only waits for a single rename.  The
+    same thread sweeps staging trees left by interrupted runs.  The thread is
+    returned (``None`` when nothing had to be deleted); it is not a daemon, so
+    the interpreter finishes the clean-up before exiting.  A symlinked
+    ``results_dir`` is cleared in place so the link keeps its target.
+    """
+
+    if results_dir.is_symlink():
+        # Renaming would move the link itself and leave its target untouched.
+        _clear_results_dir(results_dir)
+        return None
+
+    staging = results_dir.with_name(
+        f".{results_dir.name}.reset-{os.getpid()}-{time.time_ns()}"
+    )
+    try:
+        os.replace(results_dir, staging)
+    except FileNotFoundError:
+        results_dir.mkdir(parents=True, exist_ok=True)
+        return None
+    except OSError:
+        # e.g. a mount point that cannot be renamed: clear the contents in
+        # place instead.
+        _clear_results_dir(results_dir)
+        return None
 
     results_dir.mkdir(parents=True, exist_ok=True)
+    cleanup = threading.Thread(
+        target=_remove_staging_trees,
+        args=(results_dir,),
+        name="reset-results-dir",
+    )
+    cleanup.start()
+    return cleanup
 
 
-def _load_micro_payloads(results_dir: Path) -> Iterable[dict]:
-    pattern = "benchmarks-*.json"
-    for path in sorted(results_dir.glob(pattern)):
+def _iter_payloads(results_dir: Path, prefix: str, label: str) -> Iterable[dict]:
+    """Yield decoded ``<prefix>*.json`` files from ``results_dir`` in name order."""
+
+    try:
+        with os.scandir(results_dir) as entries:
+            paths = sorted(
+                entry.path
+                for entry in entries
+                if entry.name.startswith(prefix)
+                and entry.name.endswith(".json")
+                and entry.is_file()
+            )
+    except FileNotFoundError:
+        return
+
+    for path in paths:
         try:
-            yield json.loads(path.read_text())
-        except json.JSONDecodeError:
-            print(f"Warning: could not parse benchmark output '{path}'")
+            yield _json_loads(Path(path).read_bytes())
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            print(f"Warning: could not parse {label} output '{path}'")
+
+
+def _load_micro_payloads(results_dir: Path) -> Iterable[dict]:
+    return _iter_payloads(results_dir, "benchmarks-", "benchmark")
 
 
 def _load_concurrency_payloads(results_dir: Path) -> Iterable[dict]:
-    pattern = "concurrency-*.json"
-    for path in sorted(results_dir.glob(pattern)):
-        try:
-            yield json.loads(path.read_text())
-        except json.JSONDecodeError:
-            print(f"Warning: could not parse concurrency output '{path}'")
+    return _iter_payloads(results_dir, "concurrency-", "concurrency")
+
 
+_LEADING_DIGITS = re.compile(r"[0-9]+")
 
+
+@lru_cache(maxsize=256)
 def _version_key(version: str) -> Tuple[int, ...]:
     parts: List[int] = []
     for part in version.split("."):
-        digits = ""
-        for char in part:
-            if char.isdigit():
-                digits += char
-            else:
-                break
-        if digits:
-            parts.append(int(digits))
-        else:
+        match = _LEADING_DIGITS.match(part)
+        if match is None:
             break
-        if len(digits) != len(part):
+        parts.append(int(match.group()))
+        if match.end() != len(part):
             break
     return tuple(parts)
 
 
+@lru_cache(maxsize=256)
 def _version_sort_key(version: str) -> Tuple[Tuple[int, ...], int, str]:
-    variant_rank = 1 if version.lower().endswith("t") else 0
+    variant_rank = 1 if version.endswith(("t", "T")) else 0
     return (_version_key(version), variant_rank, version)
 
 
+def _micro_payload_sort_key(payload: dict) -> Tuple[str, Tuple[Tuple[int, ...], int, str]]:
+    implementation = payload.get("python_implementation", "")
+    return (implementation, _version_sort_key(payload.get("python_version", "")))
+
+
 def _runtime_metadata_sort_key(payload: dict) -> Tuple[str, Tuple[Tuple[int, ...], int, str], int, str]:
     metadata = payload.get("metadata", {}) if isinstance(payload, dict) else {}
     implementation = metadata.get("python_implementation", "")
@@ -515,42 +761,52 @@ def _runtime_metadata_sort_key(payload: dict) -> Tuple[str, Tuple[Tuple[int, ...
     return (implementation, _version_sort_key(version), gil_rank, str(version))
 
 
+def _index_by_name(entries: Iterable[dict]) -> Dict[object, dict]:
+    """Map each entry's ``name`` to the first entry carrying it."""
+
+    index: Dict[object, dict] = {}
+    for entry in entries:
+        index.setdefault(entry.get("name"), entry)
+    return index
+
+
 def _aggregate_micro_payloads(payloads: Sequence[dict]) -> dict:
-    case_order: List[str] = []
-    seen_cases = set()
-    for payload in payloads:
-        for case in payload.get("cases", []):
-            name = case.get("name")
-            if name and name not in seen_cases:
-                case_order.append(name)
-                seen_cases.add(name)
+    case_indexes = [_index_by_name(payload.get("cases", [])) for payload in payloads]
+    # Each index already preserves first-seen order within its payload, so the
+    # chained keys give the first-seen order across all payloads.
+    case_order: List[str] = [
+        name
+        for name in dict.fromkeys(name for index in case_indexes for name in index)
+        if name
+    ]
 
-    versions = [payload.get("python_version", "unknown") for payload in payloads]
-    implementations = [
-        payload.get("python_implementation", "unknown") for payload in payloads
+    # (implementation, version, iterations, repeat) per payload, read once and
+    # shared by every case row.
+    payload_meta = [
+        (
+            payload.get("python_implementation", "unknown"),
+            payload.get("python_version", "unknown"),
+            payload.get("iterations"),
+            payload.get("repeat"),
+        )
+        for payload in payloads
     ]
+    implementations = [meta[0] for meta in payload_meta]
+    versions = [meta[1] for meta in payload_meta]
     cases = []
     for case_name in case_order:
         results = []
-        for payload in payloads:
-            case_data = next(
-                (
-                    case
-                    for case in payload.get("cases", [])
-                    if case.get("name") == case_name
-                ),
-                None,
-            )
+        for meta, case_index in zip(payload_meta, case_indexes):
+            implementation, version, iterations, repeats = meta
+            case_data = case_index.get(case_name) or {}
             results.append(
                 {
-                    "python_implementation": payload.get(
-                        "python_implementation", "unknown"
-                    ),
-                    "python_version": payload.get("python_version", "unknown"),
-                    "iterations": payload.get("iterations"),
-                    "repeat": payload.get("repeat"),
-                    "mean": case_data.get("mean") if case_data else None,
-                    "stdev": case_data.get("stdev") if case_data else None,
+                    "python_implementation": implementation,
+                    "python_version": version,
+                    "iterations": iterations,
+                    "repeat": repeats,
+                    "mean": case_data.get("mean"),
+                    "stdev": case_data.get("stdev"),
                 }
             )
 
@@ -624,6 +880,10 @@ def _aggregate_concurrency_payloads(payloads: Sequence[dict]) -> dict:
                 "description": workload.get("description"),
             }
 
+    workload_indexes = [
+        _index_by_name(payload.get("workloads", [])) for payload in payloads
+    ]
+
     runtime_details: List[Dict[str, object]] = []
     for payload in payloads:
         metadata = payload.get("metadata", {}) if isinstance(payload, dict) else {}
@@ -643,15 +903,8 @@ def _aggregate_concurrency_payloads(payloads: Sequence[dict]) -> dict:
     for workload_name in workload_order:
         metadata = workload_metadata.get(workload_name, {})
         workload_results: List[Dict[str, object]] = []
-        for payload, runtime_info in zip(payloads, runtime_details):
-            workload_payload = next(
-                (
-                    workload
-                    for workload in payload.get("workloads", [])
-                    if workload.get("name") == workload_name
-                ),
-                None,
-            )
+        for workload_index, runtime_info in zip(workload_indexes, runtime_details):
+            workload_payload = workload_index.get(workload_name)
             entry: Dict[str, object] = {
                 "python_implementation": runtime_info.get(
                     "python_implementation", "unknown"
@@ -665,16 +918,15 @@ def _aggregate_concurrency_payloads(payloads: Sequence[dict]) -> dict:
             strategies: List[Dict[str, object]] = []
             if workload_payload is not None:
                 for strategy in workload_payload.get("strategies", []):
+                    get = strategy.get
                     strategies.append(
                         {
-                            "name": strategy.get("name"),
-                            "supported": bool(strategy.get("supported")),
-                            "duration": strategy.get("duration"),
-                            "tasks_per_second": strategy.get("tasks_per_second"),
-                            "speedup_vs_sequential": strategy.get(
-                                "speedup_vs_sequential"
-                            ),
-                            "reason": strategy.get("reason"),
+                            "name": get("name"),
+                            "supported": bool(get("supported")),
+                            "duration": get("duration"),
+                            "tasks_per_second": get("tasks_per_second"),
+                            "speedup_vs_sequential": get("speedup_vs_sequential"),
+                            "reason": get("reason"),
                         }
                     )
             entry["strategies"] = strategies
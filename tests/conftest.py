@@ -6,3 +6,9 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+def pytest_configure(config) -> None:
+    config.addinivalue_line(
+        "markers", "slow: runs real benchmark workloads (deselect with -m 'not slow')"
+    )
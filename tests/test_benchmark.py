@@ -8,9 +8,14 @@ import pytest
 import benchmarks.benchmark as benchmark
 
 
-def test_run_benchmarks_structure(tmp_path: Path) -> None:
-    payload = benchmark.run_benchmarks(iterations=1, repeat=2)
+@pytest.fixture(scope="module")
+def payload() -> dict:
+    """Run the full suite once and share the result across this module."""
 
+    return benchmark.run_benchmarks(iterations=1, repeat=2)
+
+
+def test_run_benchmarks_structure(payload: dict) -> None:
     assert payload["iterations"] == 1
     assert payload["repeat"] == 2
     assert isinstance(payload["python_implementation"], str)
@@ -21,7 +26,7 @@ def test_run_benchmarks_structure(tmp_path: Path) -> None:
     assert {
         "fibonacci_40",
         "fibonacci_rec_32",
-        "prime_sieve_5000",
+        "prime_count_5000",
         "json_roundtrip_500",
         "bubble_sort_10000",
         "threaded_trig_4x20000",
@@ -41,12 +46,24 @@ def test_run_benchmarks_structure(tmp_path: Path) -> None:
         assert case["mean"] >= 0
         assert case["per_iteration_mean"] >= 0
 
+
+def test_main_writes_output(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, payload: dict
+) -> None:
+    calls = []
+
+    def fake_run_benchmarks(**kwargs):
+        calls.append(kwargs)
+        return payload
+
+    monkeypatch.setattr(benchmark, "run_benchmarks", fake_run_benchmarks)
+
     output_file = tmp_path / "result.json"
-    exit_code = benchmark.main(["--iterations", "1", "--repeat", "1", "--output", str(output_file)])
+    exit_code = benchmark.main(["--iterations", "1", "--repeat", "2", "--output", str(output_file)])
     assert exit_code == 0
+    assert calls == [{"iterations": 1, "repeat": 2}]
     stored = json.loads(output_file.read_text())
-    assert stored["iterations"] == 1
-    assert "python_implementation" in stored
+    assert stored == payload
 
 
 def test_invalid_arguments() -> None:
@@ -16,3 +16,16 @@ def test_threaded_trigonometry_validates_inputs() -> None:
         compute.threaded_trigonometry(0, 100)
     with pytest.raises(ValueError):
         compute.threaded_trigonometry(2, 0)
+
+
+def test_prime_sieve_matches_trial_division() -> None:
+    def is_prime(value: int) -> bool:
+        return value >= 2 and all(value % d for d in range(2, int(value**0.5) + 1))
+
+    for limit in (0, 1, 2, 3, 10, 11, 100, 997, 1000):
+        assert compute.prime_sieve(limit) == [n for n in range(limit) if is_prime(n)]
+
+
+def test_prime_count_matches_prime_sieve() -> None:
+    for limit in (0, 1, 2, 3, 4, 100, 5000):
+        assert compute.prime_count(limit) == len(compute.prime_sieve(limit))
@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import json
 import math
+import os
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
+from typing import Dict, List
 
 import pytest
 
@@ -16,12 +19,48 @@ from benchmarks.concurrency import (
 )
 
 
+# Default workload names mapped to their categories.
+_EXPECTED_WORKLOADS: Dict[str, str] = {
+    "cpu_bound_fibonacci": "cpu",
+    "io_bound_sleep": "io",
+}
+_POOL_STRATEGIES = ("threading", "process")
+
+
 def _noop(_: object) -> None:
     return None
 
 
-def test_run_concurrency_benchmarks_structure() -> None:
-    data = run_concurrency_benchmarks(tasks=6, workers=2)
+def _exit_worker(_: object) -> None:
+    os._exit(1)
+
+
+def _stub_workloads(**supports: bool) -> List[WorkloadSpec]:
+    return [
+        WorkloadSpec(
+            name=name,
+            category=category,
+            description="No-op stand-in for the real workload.",
+            function=_noop,
+            argument=None,
+            **supports,
+        )
+        for name, category in _EXPECTED_WORKLOADS.items()
+    ]
+
+
+@pytest.mark.parametrize(
+    "workloads",
+    [
+        # The pool strategies are covered by the dedicated tests below.
+        pytest.param(_stub_workloads(supports_processes=False), id="stub"),
+        pytest.param(None, id="real", marks=pytest.mark.slow),
+    ],
+)
+def test_run_concurrency_benchmarks_structure(
+    workloads: List[WorkloadSpec] | None,
+) -> None:
+    data = run_concurrency_benchmarks(tasks=6, workers=2, workloads=workloads)
 
     metadata = data["metadata"]
     assert metadata["tasks"] == 6
@@ -30,10 +69,7 @@ def test_run_concurrency_benchmarks_structure() -> None:
     assert metadata["gil_disabled"] in (True, False, None)
 
     workloads = {workload["name"]: workload for workload in data["workloads"]}
-    assert {
-        "cpu_bound_fibonacci",
-        "io_bound_sleep",
-    }.issubset(workloads)
+    assert _EXPECTED_WORKLOADS.keys() <= workloads.keys()
 
     for workload in workloads.values():
         strategies = {entry["name"]: entry for entry in workload["strategies"]}
@@ -43,10 +79,9 @@ def test_run_concurrency_benchmarks_structure() -> None:
         if sequential["duration"] and sequential["duration"] > 0:
             assert math.isclose(sequential["speedup_vs_sequential"], 1.0)
 
-        for name in ("threading", "process"):
+        for name in _POOL_STRATEGIES:
             entry = strategies[name]
-            assert entry["supported"] is True
-            assert entry["duration"] is not None
+            assert (entry["duration"] is not None) is entry["supported"]
 
         subinterp = strategies["subinterpreters"]
         assert subinterp["duration"] is None or subinterp["duration"] >= 0
@@ -55,6 +90,53 @@ def test_run_concurrency_benchmarks_structure() -> None:
             assert isinstance(subinterp["reason"], str)
 
 
+def _assert_strategy_supported(name: str, workloads: List[WorkloadSpec]) -> None:
+    data = run_concurrency_benchmarks(tasks=4, workers=2, workloads=workloads)
+    for workload in data["workloads"]:
+        [entry] = [s for s in workload["strategies"] if s["name"] == name]
+        assert entry["supported"] is True
+        assert entry["duration"] is not None
+
+
+def test_threading_strategy_supported() -> None:
+    _assert_strategy_supported(
+        "threading",
+        _stub_workloads(supports_processes=False, supports_subinterpreters=False),
+    )
+
+
+@pytest.mark.skipif(
+    concurrency_module._detect_gil_disabled() is True
+    and bool(os.environ.get("FAST_CI")),
+    reason="threads already run in parallel on free-threaded builds",
+)
+def test_process_strategy_supported() -> None:
+    _assert_strategy_supported(
+        "process",
+        _stub_workloads(supports_threads=False, supports_subinterpreters=False),
+    )
+
+
+def test_process_pool_is_replaced_after_a_worker_dies() -> None:
+    crashing, healthy = (
+        WorkloadSpec(
+            name=name,
+            category="misc",
+            description="Process pool recovery check.",
+            function=function,
+            argument=None,
+        )
+        for name, function in (("crash", _exit_worker), ("noop", _noop))
+    )
+
+    try:
+        with pytest.raises(BrokenProcessPool):
+            concurrency_module._run_processes(crashing, 2, 2)
+        assert concurrency_module._run_processes(healthy, 2, 2) >= 0
+    finally:
+        concurrency_module._shutdown_process_pool()
+
+
 def test_run_concurrency_benchmarks_custom_workload() -> None:
     workload = WorkloadSpec(
         name="custom",
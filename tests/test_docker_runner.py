@@ -1,22 +1,78 @@
 import json
+import re
+import shutil
+import subprocess
+import threading
 from pathlib import Path
+from typing import List, Set
 
 import pytest
 
 from benchmarks import docker_runner
 
+_DOCKERFILE = b"FROM scratch\n"
+_IMAGE_TAG = re.compile(r"python-perf:(\S+)")
 
-@pytest.fixture()
-def docker_tree(tmp_path: Path) -> Path:
-    root = tmp_path / "docker"
+
+@pytest.fixture(scope="session")
+def docker_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # Built once: tests only read the tree, and the few that write (dry-run
+    # results dirs) stay inside this fixture's private parent directory.
+    root = tmp_path_factory.mktemp("context") / "docker"
     root.mkdir()
     for name in ("py3.7", "py3.11"):
         directory = root / name
         directory.mkdir()
-        (directory / "Dockerfile").write_text("FROM scratch\n")
+        (directory / "Dockerfile").write_bytes(_DOCKERFILE)
     return root
 
 
+class CommandLog:
+    """Stand-in for ``run_command`` that records commands instead of running them."""
+
+    def __init__(self) -> None:
+        self.commands: List[List[str]] = []
+
+    def record(self, command, dry_run=False) -> None:
+        self.commands.append(list(command))
+
+    def _starting_with(self, *prefix: str) -> List[List[str]]:
+        expected = list(prefix)
+        return [
+            command for command in self.commands if command[: len(expected)] == expected
+        ]
+
+    @property
+    def build_commands(self) -> List[List[str]]:
+        return self._starting_with("docker", "build")
+
+    @property
+    def run_commands(self) -> List[List[str]]:
+        return self._starting_with("docker", "run", "--rm")
+
+    @property
+    def image_versions(self) -> Set[str]:
+        return {
+            match.group(1)
+            for command in self.run_commands
+            for match in map(_IMAGE_TAG.fullmatch, command)
+            if match
+        }
+
+
+# Autouse so that no test can reach the real docker CLI by accident.
+@pytest.fixture(autouse=True)
+def command_log(monkeypatch: pytest.MonkeyPatch) -> CommandLog:
+    log = CommandLog()
+    monkeypatch.setattr(docker_runner, "run_command", log.record)
+    return log
+
+
+def _write_json(path: Path, payload: object) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(payload, handle, separators=(",", ":"))
+
+
 def test_discover_targets(docker_tree: Path) -> None:
     targets = docker_runner.discover_targets(docker_tree)
     assert [t.version for t in targets] == ["3.11", "3.7"]
@@ -24,11 +80,55 @@ def test_discover_targets(docker_tree: Path) -> None:
     assert all(target.dockerfile.name == "Dockerfile" for target in targets)
 
 
-def test_execute_runs_build_and_run(monkeypatch: pytest.MonkeyPatch, docker_tree: Path, tmp_path: Path) -> None:
-    commands = []
+def test_execute_runs_build_and_run(
+    docker_tree: Path, tmp_path: Path, command_log: CommandLog
+) -> None:
+    docker_runner.execute(
+        context=docker_tree.parent,
+        docker_root=docker_tree,
+        results_dir=tmp_path / "results",
+        aggregate=False,
+    )
+
+    run_commands = command_log.run_commands
+    assert len(run_commands) == 2
+    assert command_log.image_versions == {"3.11", "3.7"}
+    mounts = {cmd[cmd.index("-v") + 1] for cmd in run_commands}
+    assert mounts == {f"{(tmp_path / 'results').resolve()}:/app/results"}
+    build_commands = command_log.build_commands
+    assert len(build_commands) == 2
+    assert all("--progress=plain" not in cmd for cmd in build_commands)
+
+
+def test_execute_builds_images_concurrently(
+    docker_tree: Path, tmp_path: Path, command_log: CommandLog
+) -> None:
+    docker_runner.execute(
+        context=docker_tree.parent,
+        docker_root=docker_tree,
+        results_dir=tmp_path / "results",
+        aggregate=False,
+        build_jobs=2,
+    )
 
+    build_commands = command_log.build_commands
+    build_tags = {cmd[cmd.index("-t") + 1] for cmd in build_commands}
+    assert build_tags == {"python-perf:3.11", "python-perf:3.7"}
+    assert all("--progress=plain" in cmd for cmd in build_commands)
+    # Every image is built before the first container starts.
+    assert [cmd[1] for cmd in command_log.commands] == ["build", "build", "run", "run"]
+
+
+def test_execute_uses_registry_build_cache(
+    monkeypatch: pytest.MonkeyPatch,
+    docker_tree: Path,
+    tmp_path: Path,
+    command_log: CommandLog,
+) -> None:
     def fake_run(command, dry_run=False):
-        commands.append((tuple(command), dry_run))
+        if command[:2] == ["docker", "pull"] and command[2].endswith(":3.7"):
+            raise subprocess.CalledProcessError(1, command)
+        command_log.record(command, dry_run)
 
     monkeypatch.setattr(docker_runner, "run_command", fake_run)
 
@@ -37,30 +137,38 @@ def test_execute_runs_build_and_run(monkeypatch: pytest.MonkeyPatch, docker_tree
         docker_root=docker_tree,
         results_dir=tmp_path / "results",
         aggregate=False,
+        skip_run=True,
+        cache_from="ghcr.io/example/python-perf",
     )
 
-    run_commands = [list(cmd) for cmd, _ in commands if cmd[:3] == ("docker", "run", "--rm")]
-    assert len(run_commands) == 2
-    assert {
-        next(value for value in cmd if value.startswith("python-perf:"))
-        for cmd in run_commands
-    } == {"python-perf:3.11", "python-perf:3.7"}
-    volume_args = [cmd for cmd in run_commands if "-v" in cmd]
-    assert len(volume_args) == 2
-    build_commands = [cmd for cmd, _ in commands if cmd[:3] == ("docker", "build", "-f")]
-    assert len(build_commands) == 2
+    assert [cmd[:3] for cmd in command_log.commands] == [
+        ["docker", "pull", "ghcr.io/example/python-perf:3.11"],
+        ["docker", "build", "-f"],
+        ["docker", "build", "-f"],
+    ]
+    for cmd in command_log.build_commands:
+        version = cmd[cmd.index("-t") + 1].split(":")[1]
+        assert cmd[cmd.index("--cache-from") + 1] == f"ghcr.io/example/python-perf:{version}"
+        assert "BUILDKIT_INLINE_CACHE=1" in cmd
 
 
-def test_execute_resets_results_dir(
-    monkeypatch: pytest.MonkeyPatch, docker_tree: Path, tmp_path: Path
+def test_run_container_mounts_canonical_results_dir(
+    docker_tree: Path, tmp_path: Path, command_log: CommandLog
 ) -> None:
-    commands = []
+    storage = tmp_path / "storage"
+    storage.mkdir()
+    link = tmp_path / "link"
+    link.symlink_to(storage, target_is_directory=True)
+    target = docker_runner.discover_targets(docker_tree)[0]
 
-    def fake_run(command, dry_run=False):
-        commands.append((tuple(command), dry_run))
+    docker_runner.run_container(target, dry_run=False, run_cmd=None, results_dir=link)
 
-    monkeypatch.setattr(docker_runner, "run_command", fake_run)
+    assert command_log.commands == [
+        ["docker", "run", "--rm", "-v", f"{storage.resolve()}:/app/results", target.tag]
+    ]
 
+
+def test_execute_resets_results_dir(docker_tree: Path, tmp_path: Path) -> None:
     results_dir = tmp_path / "results"
     results_dir.mkdir()
     (results_dir / "stale.json").write_text("{}")
@@ -80,16 +188,153 @@ def test_execute_resets_results_dir(
     assert list(results_dir.iterdir()) == []
 
 
-def test_execute_keeps_results_dir_on_dry_run(
-    monkeypatch: pytest.MonkeyPatch, docker_tree: Path, tmp_path: Path
+def test_execute_preserves_results_dir_when_no_targets(
+    tmp_path: Path, command_log: CommandLog
 ) -> None:
-    commands = []
+    docker_root = tmp_path / "docker"
+    docker_root.mkdir()
+    results_dir = tmp_path / "results"
+    results_dir.mkdir()
+    (results_dir / "benchmarks-cpython-3.11.7.json").write_text("{}")
 
-    def fake_run(command, dry_run=False):
-        commands.append((tuple(command), dry_run))
+    targets = docker_runner.execute(
+        context=tmp_path, docker_root=docker_root, results_dir=results_dir
+    )
 
-    monkeypatch.setattr(docker_runner, "run_command", fake_run)
+    assert targets == []
+    assert command_log.commands == []
+    assert [path.name for path in results_dir.iterdir()] == [
+        "benchmarks-cpython-3.11.7.json"
+    ]
+
+
+def test_reset_results_dir_deletes_previous_tree_in_background(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    results_dir = tmp_path / "results"
+    (results_dir / "nested").mkdir(parents=True)
+    (results_dir / "nested" / "artifact.txt").write_text("data")
+    leftover = tmp_path / ".results.reset-1-1"
+    leftover.mkdir()
+
+    started = threading.Event()
+    release = threading.Event()
+    rmtree = shutil.rmtree
+
+    def blocking_rmtree(path, **kwargs):
+        started.set()
+        release.wait(timeout=5)
+        rmtree(path, **kwargs)
+
+    monkeypatch.setattr(docker_runner.shutil, "rmtree", blocking_rmtree)
+
+    cleanup = docker_runner._reset_results_dir(results_dir)
+    assert cleanup is not None
+    try:
+        # The reset has returned while the old tree is still being deleted.
+        assert started.wait(timeout=5)
+        assert cleanup.is_alive()
+        assert list(results_dir.iterdir()) == []
+        # Trees left by earlier runs are swept by the same thread.
+        assert leftover.exists()
+    finally:
+        release.set()
+        cleanup.join()
+    assert list(tmp_path.iterdir()) == [results_dir]
+
+
+def test_reset_results_dir_clears_in_place_when_rename_fails(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    results_dir = tmp_path / "results"
+    (results_dir / "nested").mkdir(parents=True)
+    (results_dir / "nested" / "artifact.txt").write_text("data")
+    (results_dir / "stale.json").write_text("{}")
+
+    def failing_replace(src, dst):
+        raise OSError("device or resource busy")
+
+    monkeypatch.setattr(docker_runner.os, "replace", failing_replace)
+
+    assert docker_runner._reset_results_dir(results_dir) is None
+    assert list(results_dir.iterdir()) == []
+
+
+def test_reset_results_dir_sweeps_stale_staging_trees(tmp_path: Path) -> None:
+    results_dir = tmp_path / "results"
+    results_dir.mkdir()
+    (results_dir / "stale.json").write_text("{}")
+    stale = tmp_path / ".results.reset-1-1700000000000000000"
+    (stale / "nested").mkdir(parents=True)
+    (stale / "nested" / "artifact.txt").write_text("data")
+    unrelated = tmp_path / "results-old"
+    unrelated.mkdir()
+
+    cleanup = docker_runner._reset_results_dir(results_dir)
+    if cleanup is not None:
+        cleanup.join()
+
+    assert list(results_dir.iterdir()) == []
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "results",
+        "results-old",
+    ]
+
+
+def test_reset_results_dir_keeps_siblings_it_did_not_create(tmp_path: Path) -> None:
+    results_dir = tmp_path / "results"
+    results_dir.mkdir()
+    backup = tmp_path / "results.old.2024"
+    backup.mkdir()
+    (backup / "benchmarks-cpython-3.11.7.json").write_text("{}")
+    (tmp_path / "results.old.1").mkdir()
+    (tmp_path / ".results.reset-backup").mkdir()
+
+    cleanup = docker_runner._reset_results_dir(results_dir)
+    if cleanup is not None:
+        cleanup.join()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        ".results.reset-backup",
+        "results",
+        "results.old.1",
+        "results.old.2024",
+    ]
+    assert (backup / "benchmarks-cpython-3.11.7.json").exists()
+
+
+def test_reset_results_dir_matches_staging_names_literally(tmp_path: Path) -> None:
+    results_dir = tmp_path / "r[1]"
+    results_dir.mkdir()
+    (tmp_path / ".r[1].reset-7-1").mkdir()
+    unrelated = tmp_path / ".r1.reset-5-1"
+    unrelated.mkdir()
+
+    cleanup = docker_runner._reset_results_dir(results_dir)
+    if cleanup is not None:
+        cleanup.join()
 
+    assert sorted(path.name for path in tmp_path.iterdir()) == [".r1.reset-5-1", "r[1]"]
+
+
+def test_reset_results_dir_clears_symlink_target_in_place(tmp_path: Path) -> None:
+    storage = tmp_path / "storage"
+    (storage / "nested").mkdir(parents=True)
+    (storage / "nested" / "artifact.txt").write_text("data")
+    (storage / "stale.json").write_text("{}")
+    results_dir = tmp_path / "results"
+    results_dir.symlink_to(storage, target_is_directory=True)
+
+    assert docker_runner._reset_results_dir(results_dir) is None
+
+    assert results_dir.is_symlink()
+    assert list(storage.iterdir()) == []
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["results", "storage"]
+
+
+def test_execute_keeps_results_dir_on_dry_run(
+    docker_tree: Path, tmp_path: Path
+) -> None:
     results_dir = tmp_path / "results"
     results_dir.mkdir()
     stale_file = results_dir / "stale.json"
@@ -108,14 +353,7 @@ def test_execute_keeps_results_dir_on_dry_run(
     assert stale_file.read_text() == "{}"
 
 
-def test_main_supports_run_cmd(monkeypatch: pytest.MonkeyPatch, docker_tree: Path) -> None:
-    commands = []
-
-    def fake_run(command, dry_run=False):
-        commands.append(command)
-
-    monkeypatch.setattr(docker_runner, "run_command", fake_run)
-
+def test_main_supports_run_cmd(docker_tree: Path, command_log: CommandLog) -> None:
     exit_code = docker_runner.main(
         [
             "--docker-root",
@@ -130,25 +368,15 @@ def test_main_supports_run_cmd(monkeypatch: pytest.MonkeyPatch, docker_tree: Pat
         ]
     )
     assert exit_code == 0
-    run_commands = [cmd for cmd in commands if cmd[:3] == ["docker", "run", "--rm"]]
+    run_commands = command_log.run_commands
     assert len(run_commands) == 2
-    assert {
-        next(value for value in cmd if value.startswith("python-perf:"))
-        for cmd in run_commands
-    } == {"python-perf:3.11", "python-perf:3.7"}
+    assert command_log.image_versions == {"3.11", "3.7"}
     assert run_commands[0][-4:] == ["python", "-m", "pytest", "-q"]
 
 
 def test_main_supports_iteration_overrides(
-    monkeypatch: pytest.MonkeyPatch, docker_tree: Path
+    docker_tree: Path, command_log: CommandLog
 ) -> None:
-    commands = []
-
-    def fake_run(command, dry_run=False):
-        commands.append((tuple(command), dry_run))
-
-    monkeypatch.setattr(docker_runner, "run_command", fake_run)
-
     exit_code = docker_runner.main(
         [
             "--docker-root",
@@ -166,7 +394,7 @@ def test_main_supports_iteration_overrides(
     )
 
     assert exit_code == 0
-    run_commands = [list(cmd) for cmd, _ in commands if cmd[:3] == ("docker", "run", "--rm")]
+    run_commands = command_log.run_commands
     assert len(run_commands) == 2
     assert run_commands[0][-7:] == [
         "python",
@@ -183,15 +411,8 @@ def test_main_supports_iteration_overrides(
 
 
 def test_main_supports_concurrency_suite(
-    monkeypatch: pytest.MonkeyPatch, docker_tree: Path
+    docker_tree: Path, command_log: CommandLog
 ) -> None:
-    commands = []
-
-    def fake_run(command, dry_run=False):
-        commands.append((command, dry_run))
-
-    monkeypatch.setattr(docker_runner, "run_command", fake_run)
-
     exit_code = docker_runner.main(
         [
             "--docker-root",
@@ -211,7 +432,7 @@ def test_main_supports_concurrency_suite(
     )
 
     assert exit_code == 0
-    run_commands = [cmd for cmd, _ in commands if cmd[:3] == ["docker", "run", "--rm"]]
+    run_commands = command_log.run_commands
     assert len(run_commands) == 2
     assert run_commands[0][-7:] == [
         "python",
@@ -225,21 +446,14 @@ def test_main_supports_concurrency_suite(
 
 
 def test_execute_runs_disable_gil_variant_for_python_314(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    tmp_path: Path, command_log: CommandLog
 ) -> None:
-    commands = []
-
-    def fake_run(command, dry_run=False):
-        commands.append((command, dry_run))
-
     docker_root = tmp_path / "docker"
     context = tmp_path
     docker_root.mkdir()
     target_dir = docker_root / "py3.14"
     target_dir.mkdir()
-    (target_dir / "Dockerfile").write_text("FROM scratch\n")
-
-    monkeypatch.setattr(docker_runner, "run_command", fake_run)
+    (target_dir / "Dockerfile").write_bytes(_DOCKERFILE)
 
     docker_runner.execute(
         context=context,
@@ -249,21 +463,16 @@ def test_execute_runs_disable_gil_variant_for_python_314(
         suite="concurrency",
     )
 
-    run_commands = [cmd for cmd, _ in commands if cmd[:3] == ["docker", "run", "--rm"]]
+    run_commands = command_log.run_commands
     assert len(run_commands) == 2
     regular, nogil = run_commands
     assert "--disable-gil" not in regular
     assert "--disable-gil" in nogil
 
 
-def test_main_rejects_conflicting_command(monkeypatch: pytest.MonkeyPatch, docker_tree: Path) -> None:
-    commands = []
-
-    def fake_run(command, dry_run=False):
-        commands.append(command)
-
-    monkeypatch.setattr(docker_runner, "run_command", fake_run)
-
+def test_main_rejects_conflicting_command(
+    docker_tree: Path, command_log: CommandLog
+) -> None:
     exit_code = docker_runner.main(
         [
             "--docker-root",
@@ -279,19 +488,12 @@ def test_main_rejects_conflicting_command(monkeypatch: pytest.MonkeyPatch, docke
     )
 
     assert exit_code == 1
-    assert commands == []
+    assert command_log.commands == []
 
 
 def test_main_rejects_invalid_concurrency_overrides(
-    monkeypatch: pytest.MonkeyPatch, docker_tree: Path
+    docker_tree: Path, command_log: CommandLog
 ) -> None:
-    commands = []
-
-    def fake_run(command, dry_run=False):
-        commands.append(command)
-
-    monkeypatch.setattr(docker_runner, "run_command", fake_run)
-
     exit_code = docker_runner.main(
         [
             "--docker-root",
@@ -307,19 +509,12 @@ def test_main_rejects_invalid_concurrency_overrides(
     )
 
     assert exit_code == 1
-    assert commands == []
+    assert command_log.commands == []
 
 
 def test_main_rejects_tasks_without_concurrency(
-    monkeypatch: pytest.MonkeyPatch, docker_tree: Path
+    docker_tree: Path, command_log: CommandLog
 ) -> None:
-    commands = []
-
-    def fake_run(command, dry_run=False):
-        commands.append(command)
-
-    monkeypatch.setattr(docker_runner, "run_command", fake_run)
-
     exit_code = docker_runner.main(
         [
             "--docker-root",
@@ -333,7 +528,7 @@ def test_main_rejects_tasks_without_concurrency(
     )
 
     assert exit_code == 1
-    assert commands == []
+    assert command_log.commands == []
 
 
 def test_summarize_results(tmp_path: Path) -> None:
@@ -384,10 +579,10 @@ def test_summarize_results(tmp_path: Path) -> None:
             {"name": "case1", "mean": 0.05, "stdev": 0.01},
         ],
     }
-    (results_dir / "benchmarks-cpython-3.14.0.json").write_text(json.dumps(payload))
-    (results_dir / "benchmarks-pypy-3.12.1.json").write_text(json.dumps(payload2))
-    (results_dir / "benchmarks-cpython-3.11.7-alt.json").write_text(json.dumps(payload3))
-    (results_dir / "benchmarks-cpython-3.14.0t.json").write_text(json.dumps(payload4))
+    _write_json(results_dir / "benchmarks-cpython-3.14.0.json", payload)
+    _write_json(results_dir / "benchmarks-pypy-3.12.1.json", payload2)
+    _write_json(results_dir / "benchmarks-cpython-3.11.7-alt.json", payload3)
+    _write_json(results_dir / "benchmarks-cpython-3.14.0t.json", payload4)
 
     summary_text = docker_runner.summarize_results(results_dir)
     assert summary_text is not None
@@ -436,8 +631,53 @@ def test_baseline_mean_prefers_standard_gil_build() -> None:
     assert baseline == pytest.approx(0.1)
 
 
+def test_version_sort_key_orders_numeric_components() -> None:
+    assert docker_runner._version_key("3.14.0rc1") == (3, 14, 0)
+    assert docker_runner._version_key("3.x") == (3,)
+    versions = ["3.14t", "3.9", "3.14", "3.10"]
+    assert sorted(versions, key=docker_runner._version_sort_key) == [
+        "3.9",
+        "3.10",
+        "3.14",
+        "3.14t",
+    ]
+
+
 def test_summarize_results_handles_missing(tmp_path: Path) -> None:
     assert docker_runner.summarize_results(tmp_path) is None
+    missing = tmp_path / "missing"
+    assert docker_runner.summarize_results(missing) is None
+    assert docker_runner.summarize_results(missing, suite="concurrency") is None
+    assert not missing.exists()
+
+
+def test_write_summary_keeps_previous_file_on_failure(tmp_path: Path) -> None:
+    summary_path = tmp_path / "summary.json"
+    docker_runner._write_summary(summary_path, {"cases": []})
+    assert json.loads(summary_path.read_text()) == {"cases": []}
+
+    # json.dump fails part-way through, after writing the opening of the list.
+    with pytest.raises(TypeError):
+        docker_runner._write_summary(summary_path, {"cases": [object()]})
+
+    assert json.loads(summary_path.read_text()) == {"cases": []}
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["summary.json"]
+
+
+def test_load_micro_payloads_skips_unparseable_and_unrelated_entries(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    _write_json(tmp_path / "benchmarks-b.json", {"name": "b"})
+    _write_json(tmp_path / "benchmarks-a.json", {"name": "a"})
+    (tmp_path / "benchmarks-broken.json").write_text("{")
+    (tmp_path / "benchmarks-dir.json").mkdir()
+    (tmp_path / "summary.json").write_text("{}")
+
+    payloads = list(docker_runner._load_micro_payloads(tmp_path))
+
+    assert payloads == [{"name": "a"}, {"name": "b"}]
+    assert "benchmarks-broken.json" in capsys.readouterr().out
+    assert list(docker_runner._load_micro_payloads(tmp_path / "missing")) == []
 
 
 def test_summarize_concurrency_results(tmp_path: Path) -> None:
@@ -515,10 +755,8 @@ def test_summarize_concurrency_results(tmp_path: Path) -> None:
             }
         ],
     }
-    (results_dir / "concurrency-cpython-3.14.0.json").write_text(json.dumps(payload))
-    (results_dir / "concurrency-cpython-3.14.0-nogil.json").write_text(
-        json.dumps(payload2)
-    )
+    _write_json(results_dir / "concurrency-cpython-3.14.0.json", payload)
+    _write_json(results_dir / "concurrency-cpython-3.14.0-nogil.json", payload2)
 
     summary_text = docker_runner.summarize_results(results_dir, suite="concurrency")
     assert summary_text is not None